@@ -10,39 +10,285 @@ This application implements a console-based banking system with the following fe
 - Account management capabilities
 """
 
+import bisect
+import csv
 import datetime
-import uuid
+import itertools
+import math
 import os
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Callable, Any, Union
+from array import array
+from enum import IntEnum
+from typing import List, Dict, Optional, Callable, Any, Union, Iterator, Tuple, ClassVar, Sequence
+
+
+# Random bytes are drawn from the OS in 4 KiB chunks and sliced 16 at a time,
+# so identifiers do not pay for a syscall and a UUID object on every call.
+_RNG_BUF = bytearray()
+_RNG_POS = 0
+
+
+def _fast_id() -> str:
+    """Return a random 32-character hex identifier."""
+    global _RNG_BUF, _RNG_POS
+    if _RNG_POS + 16 > len(_RNG_BUF):
+        _RNG_BUF = bytearray(os.urandom(4096))
+        _RNG_POS = 0
+    pos = _RNG_POS
+    _RNG_POS = pos + 16
+    return _RNG_BUF[pos:pos + 16].hex()
+
+
+# (expiry_epoch, period) for the current calendar month, where period is
+# year * 12 + month. Recomputed at most once a day, at local midnight.
+_CACHED_PERIOD = [0.0, 0]
+
+
+def _current_period() -> int:
+    """Return the current calendar month as a single comparable integer."""
+    if time.time() < _CACHED_PERIOD[0]:
+        return _CACHED_PERIOD[1]
+    today = datetime.date.today()
+    tomorrow = today + datetime.timedelta(days=1)
+    _CACHED_PERIOD[0] = time.mktime(tomorrow.timetuple())
+    _CACHED_PERIOD[1] = today.year * 12 + today.month
+    return _CACHED_PERIOD[1]
+
+
+# Bound formatters for the display methods, so each row skips re-parsing
+# its format spec.
+_fmt_money = "£{:.2f}".format
+_fmt_account_row = "{} | {:<8} | {:<20} | £{:.2f}".format
+
+
+# Largest amount, in pence, accepted anywhere. Amounts are stored in int64
+# columns and read back as float pounds, so this stays within the range a
+# float holds exactly and well inside int64.
+_MAX_PENCE = 2 ** 53
+
+
+def _to_pence(amount: float) -> int:
+    """
+    Convert an amount in pounds to a whole number of pence.
+
+    Raises:
+        InvalidAmountError: If amount is not a finite number or is too large to store
+    """
+    if not math.isfinite(amount):
+        raise InvalidAmountError("Amount must be a finite number")
+    pence = int(round(amount * 100))
+    if not -_MAX_PENCE <= pence <= _MAX_PENCE:
+        raise InvalidAmountError(f"Amount must be no more than £{_MAX_PENCE // 100:,}")
+    return pence
+
+
+class AccountType(IntEnum):
+    """Small integer codes for the kinds of account."""
+
+    CHECKING = 0
+    SAVINGS = 1
+
+    @property
+    def label(self) -> str:
+        """Return the display name of the account type."""
+        return self.name.capitalize()
+
+
+class TransactionKind(IntEnum):
+    """Small integer codes for the kinds of transaction."""
+
+    DEPOSIT = 0
+    WITHDRAWAL = 1
+    TRANSFER = 2
+    INTEREST = 3
+    REJECTED = 4
+
+    @property
+    def label(self) -> str:
+        """Return the display name of the transaction kind."""
+        return self.name.capitalize()
+
+
+# TransactionKind members indexed by their code, for decoding stored kind bytes
+_TRANSACTION_KINDS = tuple(TransactionKind)
 
 
 class Transaction:
     """Represents a single transaction in the banking system."""
 
-    def __init__(self, transaction_type: str, amount: float, description: str = "", timestamp: datetime.datetime = None):
+    __slots__ = ("transaction_id", "transaction_type", "amount", "description", "timestamp", "_type_cap", "_fmt")
+
+    def __init__(self, transaction_type: Union[TransactionKind, str], amount: float, description: str = "",
+                 timestamp: Optional[int] = None, transaction_id: Optional[str] = None):
         """
         Initialize a new transaction.
 
         Args:
-            transaction_type: Type of transaction ('deposit', 'withdrawal', 'transfer', 'interest')
+            transaction_type: Kind of transaction, as a TransactionKind or its name
+                ('deposit', 'withdrawal', 'transfer', 'interest', 'rejected')
             amount: Amount of money involved in the transaction
             description: Additional details about the transaction
-            timestamp: When the transaction occurred (defaults to current time)
+            timestamp: When the transaction occurred, as nanoseconds since the epoch (defaults to current time)
+            transaction_id: Existing ID when rebuilding a stored transaction (defaults to a new ID)
+
+        Raises:
+            ValueError: If transaction_type is not a known kind of transaction
         """
-        self.transaction_id = str(uuid.uuid4())
+        if isinstance(transaction_type, str):
+            try:
+                transaction_type = TransactionKind[transaction_type.upper()]
+            except KeyError:
+                raise ValueError(f"Unknown transaction type: {transaction_type}") from None
+
+        self.transaction_id = transaction_id if transaction_id else _fast_id()
         self.transaction_type = transaction_type
-        self.amount = amount
+        self.amount = float(amount)
         self.description = description
-        self.timestamp = timestamp if timestamp else datetime.datetime.now()
+        self.timestamp = timestamp if timestamp else time.time_ns()
+        self._type_cap = transaction_type.label
+        self._fmt: Optional[str] = None  # Formatted timestamp, filled in on first display
 
     def __str__(self) -> str:
         """Return a string representation of the transaction."""
-        formatted_time = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        transaction_info = f"{self.transaction_type.capitalize()}: £{self.amount:.2f}"
+        if self._fmt is None:
+            self._fmt = datetime.datetime.fromtimestamp(self.timestamp / 1e9).strftime("%Y-%m-%d %H:%M:%S")
         if self.description:
-            transaction_info += f" | {self.description}"
-        return f"{formatted_time} | {transaction_info}"
+            return f"{self._fmt} | {self._type_cap}: {_fmt_money(self.amount)} | {self.description}"
+        return f"{self._fmt} | {self._type_cap}: {_fmt_money(self.amount)}"
+
+
+class TransactionLog:
+    """
+    Column-oriented storage for an account's transaction history.
+
+    Amounts (in pence) and timestamps are packed into typed arrays and the remaining fields
+    into parallel lists, so a long history holds no per-transaction objects.
+    Transaction objects are rebuilt only when rows are read back.
+    """
+
+    __slots__ = ("_ids", "_types", "_amounts", "_descriptions", "_timestamps", "_rendered", "_in_time_order")
+
+    def __init__(self):
+        """Initialize an empty transaction log."""
+        self._ids: List[str] = []
+        self._types = array("B")  # TransactionKind codes, one byte each
+        self._amounts = array("q")  # Whole pence
+        self._descriptions: List[str] = []
+        self._timestamps = array("q")  # Nanoseconds since the epoch
+        # Display line for each row once formatted (None until first shown); rows never change once stored
+        self._rendered: List[Optional[str]] = []
+        # False once a row is stored with an earlier timestamp than the row before it
+        self._in_time_order = True
+
+    def append(self, transaction: Transaction) -> None:
+        """
+        Store a transaction at the end of the log.
+
+        Timestamps are stored exactly as recorded. A wall-clock step back or an
+        explicit past time may leave them out of order, which iter_since allows for.
+
+        Args:
+            transaction: Transaction to store
+        """
+        # Convert and validate first, so a bad row never leaves the columns out of step
+        pence = _to_pence(transaction.amount)
+        out_of_order = bool(self._timestamps) and transaction.timestamp < self._timestamps[-1]
+        self._timestamps.append(transaction.timestamp)  # The only append that can still fail
+        if out_of_order:
+            self._in_time_order = False
+        self._amounts.append(pence)
+        self._types.append(transaction.transaction_type)
+        self._ids.append(transaction.transaction_id)
+        self._descriptions.append(transaction.description)
+
+    def _row(self, index: int) -> Transaction:
+        """Rebuild the transaction stored at a given index."""
+        return Transaction(_TRANSACTION_KINDS[self._types[index]], self._amounts[index] / 100, self._descriptions[index],
+                           self._timestamps[index], self._ids[index])
+
+    def __len__(self) -> int:
+        """Return the number of stored transactions."""
+        return len(self._amounts)
+
+    def __iter__(self) -> Iterator[Transaction]:
+        """Iterate over the stored transactions, oldest first."""
+        for kind_code, amount, description, timestamp, transaction_id in zip(
+                self._types, self._amounts, self._descriptions, self._timestamps, self._ids):
+            yield Transaction(_TRANSACTION_KINDS[kind_code], amount / 100, description, timestamp, transaction_id)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Transaction, List[Transaction]]:
+        """Return the transaction at an index, or a list of transactions for a slice."""
+        rows = range(len(self._amounts))[index]
+        if isinstance(index, slice):
+            return [self._row(i) for i in rows]
+        return self._row(rows)
+
+    def iter_from(self, start: int = 0) -> Iterator[Transaction]:
+        """
+        Lazily iterate over the stored transactions from a given index.
+
+        Args:
+            start: Index of the first row to yield
+
+        Returns:
+            An iterator that rebuilds each transaction only as it is reached
+        """
+        return map(self._row, range(start, len(self._amounts)))
+
+    def iter_since(self, timestamp: int, start: int = 0) -> Iterator[Transaction]:
+        """
+        Lazily iterate over the transactions recorded at or after a timestamp.
+
+        While the timestamps are in order the first match is found by binary search;
+        once a row has been stored out of order every row is checked instead.
+
+        Args:
+            timestamp: Nanoseconds since the epoch
+            start: Index of the first row to consider
+
+        Returns:
+            An iterator over the matching rows from start onwards, in log order
+        """
+        timestamps = self._timestamps
+        if self._in_time_order:
+            return self.iter_from(max(start, bisect.bisect_left(timestamps, timestamp)))
+        return map(self._row, (index for index in range(start, len(timestamps)) if timestamps[index] >= timestamp))
+
+    def render(self, start: int = 0) -> List[str]:
+        """
+        Get display lines for the stored transactions.
+
+        Rows are formatted the first time they are requested and cached, so
+        repeated displays only format transactions not shown before.
+
+        Args:
+            start: Index of the first row to return
+
+        Returns:
+            One formatted line per transaction from start onwards
+        """
+        rendered = self._rendered
+        rendered.extend([None] * (len(self._amounts) - len(rendered)))
+        for index in range(start, len(rendered)):
+            if rendered[index] is None:
+                rendered[index] = str(self._row(index))
+        return rendered[start:]
+
+    def total(self, transaction_type: TransactionKind) -> int:
+        """
+        Sum the amounts of every stored transaction of a given type.
+
+        Args:
+            transaction_type: Type of transaction to total
+
+        Returns:
+            The summed amount in pence
+        """
+        # Mask the amount column with the kind column so the scan and sum stay in C
+        mask = map(int(transaction_type).__eq__, self._types)
+        return sum(itertools.compress(self._amounts, mask))
 
 
 class InsufficientFundsError(Exception):
@@ -63,6 +309,11 @@ class MonthlyWithdrawalLimitError(Exception):
 class Account(ABC):
     """Abstract base class for all account types."""
 
+    __slots__ = ("_account_number", "_account_key", "_name", "_balance", "_transactions", "_created_date",
+                 "_on_balance_change", "_summary_cache", "_total_deposits", "_total_withdrawals")
+
+    ACCOUNT_TYPE: ClassVar[AccountType]
+
     def __init__(self, name: str, initial_balance: float = 0.0):
         """
         Initialize a new account.
@@ -77,15 +328,62 @@ class Account(ABC):
         if initial_balance < 0:
             raise InvalidAmountError("Initial balance cannot be negative")
 
-        self._account_number = str(uuid.uuid4())[:8]  # First 8 chars of UUID
+        self._account_number = _fast_id()[:8]  # First 8 hex chars of a random ID
+        self._account_key = int(self._account_number, 16)  # Integer form used for bank lookups
         self._name = name
-        self._balance = initial_balance
-        self._transactions: List[Transaction] = []
+        self._balance = _to_pence(initial_balance)  # Whole pence, so sums are exact
+        self._transactions = TransactionLog()
         self._created_date = datetime.datetime.now()
+        # Called with each balance delta; set by the owning Bank to keep its totals current
+        self._on_balance_change: Optional[Callable[[int], None]] = None
+        # (fingerprint, text) of the last summary built, reused while nothing has changed
+        self._summary_cache: Optional[Tuple[Tuple[int, int], str]] = None
+        # Running totals kept alongside the balance so summaries never re-read the history
+        self._total_deposits = self._balance
+        self._total_withdrawals = 0
 
         # Record initial deposit if any
-        if initial_balance > 0:
-            self._transactions.append(Transaction("deposit", initial_balance, "Initial deposit"))
+        if self._balance > 0:
+            self._transactions.append(Transaction(TransactionKind.DEPOSIT, initial_balance, "Initial deposit"))
+
+    @classmethod
+    def _fast_init(cls, name: str) -> "Account":
+        """
+        Create an account with a zero balance, skipping the balance checks in __init__.
+
+        Args:
+            name: Account holder's name
+
+        Returns:
+            The new, empty account
+        """
+        self = cls.__new__(cls)
+        self._account_number = _fast_id()[:8]
+        self._account_key = int(self._account_number, 16)
+        self._name = name
+        self._balance = 0
+        self._transactions = TransactionLog()
+        self._created_date = datetime.datetime.now()
+        self._on_balance_change = None
+        self._summary_cache = None
+        self._total_deposits = 0
+        self._total_withdrawals = 0
+        return self
+
+    @staticmethod
+    def _check_positive(amount: Union[int, float], label: str) -> None:
+        """
+        Validate that an amount is positive.
+
+        Args:
+            amount: Amount to validate
+            label: Name of the operation, used in the error message
+
+        Raises:
+            InvalidAmountError: If amount is negative or zero
+        """
+        if amount <= 0:
+            raise InvalidAmountError(f"{label} amount must be positive")
 
     @property
     def account_number(self) -> str:
@@ -99,100 +397,190 @@ class Account(ABC):
 
     @property
     def balance(self) -> float:
-        """Get the current account balance."""
-        return self._balance
+        """Get the current account balance in pounds."""
+        return self._balance / 100
 
     @property
     def created_date(self) -> datetime.datetime:
         """Get the account creation date."""
         return self._created_date
 
-    def deposit(self, amount: float, description: str = "") -> None:
+    def deposit(self, amount: float, description: str = "", now: Optional[int] = None) -> Transaction:
         """
         Deposit money into the account.
 
         Args:
             amount: Amount to deposit
             description: Optional description of the deposit
+            now: Timestamp to record (defaults to current time)
+
+        Returns:
+            The recorded deposit transaction
 
         Raises:
             InvalidAmountError: If amount is negative or zero
         """
-        if amount <= 0:
-            raise InvalidAmountError("Deposit amount must be positive")
-
-        self._balance += amount
-        self._transactions.append(Transaction("deposit", amount, description))
-        print(f"Deposited £{amount:.2f} successfully")
-
-    def withdraw(self, amount: float, description: str = "") -> None:
+        pence = _to_pence(amount)
+        self._check_positive(pence, "Deposit")
+
+        # Log the row first; if it cannot be stored the balance is left untouched
+        transaction = Transaction(TransactionKind.DEPOSIT, pence / 100, description, now)
+        self._transactions.append(transaction)
+        self._balance += pence
+        self._total_deposits += pence
+        if self._on_balance_change:
+            self._on_balance_change(pence)
+        return transaction
+
+    def withdraw(self, amount: float, description: str = "", now: Optional[int] = None) -> Transaction:
         """
         Withdraw money from the account.
 
         Args:
             amount: Amount to withdraw
             description: Optional description of the withdrawal
+            now: Timestamp to record (defaults to current time)
+
+        Returns:
+            The recorded withdrawal transaction
 
         Raises:
             InvalidAmountError: If amount is negative or zero
             InsufficientFundsError: If withdrawal would result in negative balance
         """
-        if amount <= 0:
-            raise InvalidAmountError("Withdrawal amount must be positive")
-
-        if amount > self._balance:
-            raise InsufficientFundsError(f"Insufficient funds. Current balance: £{self._balance:.2f}")
-
-        self._balance -= amount
-        self._transactions.append(Transaction("withdrawal", amount, description))
-        print(f"Withdrew £{amount:.2f} successfully")
-
-    def add_transaction_record(self, transaction_type: str, amount: float, description: str = "") -> None:
+        # One combined test on the success path; work out which error it was only on failure
+        pence = _to_pence(amount)
+        if pence <= 0 or pence > self._balance:
+            self._check_positive(pence, "Withdrawal")
+            raise InsufficientFundsError(f"Insufficient funds. Current balance: £{self._balance / 100:.2f}")
+
+        transaction = Transaction(TransactionKind.WITHDRAWAL, pence / 100, description, now)
+        self._transactions.append(transaction)
+        self._balance -= pence
+        self._total_withdrawals += pence
+        if self._on_balance_change:
+            self._on_balance_change(-pence)
+        return transaction
+
+    def add_transaction_record(self, transaction_type: Union[TransactionKind, str], amount: float, description: str = "",
+                               now: Optional[int] = None) -> None:
         """
         Add a transaction record without affecting balance (for transfers).
 
         Args:
-            transaction_type: Type of transaction
+            transaction_type: Kind of transaction, as a TransactionKind or its name
             amount: Amount involved
             description: Description of the transaction
+            now: Timestamp to record (defaults to current time)
+        """
+        self._transactions.append(Transaction(transaction_type, amount, description, now))
+
+    def snapshot_transactions(self) -> Tuple[Transaction, ...]:
+        """Get an immutable snapshot of all transactions for this account."""
+        return tuple(self._transactions)
+
+    def iter_transactions(self) -> Iterator[Transaction]:
+        """Iterate over the account's transactions without copying them."""
+        return iter(self._transactions)
+
+    def get_transaction_history(self, limit: Optional[int] = None,
+                                since: Optional[int] = None) -> Iterator[Transaction]:
+        """
+        Lazily iterate over part of the transaction history.
+
+        Args:
+            limit: Yield at most this many of the most recent transactions (None for no limit)
+            since: Yield only transactions recorded at or after this time, in nanoseconds since the epoch
+
+        Returns:
+            An iterator over the selected transactions, oldest first
+        """
+        log = self._transactions
+        start = 0 if limit is None else max(len(log) - max(limit, 0), 0)
+        if since is None:
+            return log.iter_from(start)
+        return log.iter_since(since, start)
+
+    def recent(self, n: int = 20) -> List[Transaction]:
+        """
+        Get the most recent transactions.
+
+        Args:
+            n: Maximum number of transactions to return
+
+        Returns:
+            Up to n transactions, oldest first
         """
-        self._transactions.append(Transaction(transaction_type, amount, description))
+        # Slicing from the tail costs O(n) regardless of the history length
+        return self._transactions[-n:] if n > 0 else []
 
-    def get_transaction_history(self) -> List[Transaction]:
-        """Get a list of all transactions for this account."""
-        return self._transactions.copy()
+    def display_transaction_history(self, n: Optional[int] = 50) -> None:
+        """
+        Display transactions in a formatted manner.
 
-    def display_transaction_history(self) -> None:
-        """Display all transactions in a formatted manner."""
+        Args:
+            n: Show only the most recent n transactions (None shows all)
+        """
         if not self._transactions:
             print("No transactions to display")
             return
 
-        print("\n===== Transaction History =====")
-        print("Date & Time           | Transaction")
-        print("------------------------|-----------------")
-        for transaction in self._transactions:
-            print(transaction)
-        print("===============================\n")
+        # Collect every line and emit them with a single write
+        out = ["\n===== Transaction History =====",
+               "Date & Time           | Transaction",
+               "------------------------|-----------------"]
+        total = len(self._transactions)
+        if n is None or n >= total:
+            out.extend(self._transactions.render())
+        else:
+            out.append(f"... {total - n} earlier transactions not shown")
+            out.extend(self._transactions.render(total - n))
+        out.append("===============================\n")
+        sys.stdout.write("\n".join(out) + "\n")
 
     def get_account_summary(self) -> str:
         """Get a detailed summary of the account."""
+        fingerprint = (self._balance, len(self._transactions))
+        if self._summary_cache is not None and self._summary_cache[0] == fingerprint:
+            return self._summary_cache[1]
+
         summary = [
-            f"Account Type: {self.get_account_type()}",
+            f"Account Type: {self.ACCOUNT_TYPE.label}",
             f"Account Number: {self._account_number}",
             f"Account Holder: {self._name}",
-            f"Current Balance: £{self._balance:.2f}",
+            "Current Balance: " + _fmt_money(self._balance / 100),
             f"Created On: {self._created_date.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Number of Transactions: {len(self._transactions)}"
+            f"Number of Transactions: {len(self._transactions)}",
+            "Total Deposits: " + _fmt_money(self._total_deposits / 100),
+            "Total Withdrawals: " + _fmt_money(self._total_withdrawals / 100)
         ]
-        return "\n".join(summary)
+        text = "\n".join(summary)
+        self._summary_cache = (fingerprint, text)
+        return text
+
+    def verify_invariants(self) -> bool:
+        """
+        Reconcile the running totals and balance against the transaction log.
+
+        This re-reads the whole history and is intended as a debugging aid.
+
+        Returns:
+            True if the cached totals agree with the recorded transactions
+        """
+        log = self._transactions
+        deposits = log.total(TransactionKind.DEPOSIT)
+        withdrawals = log.total(TransactionKind.WITHDRAWAL)
+        expected_balance = deposits - withdrawals + log.total(TransactionKind.INTEREST)
+        return (self._total_deposits == deposits
+                and self._total_withdrawals == withdrawals
+                and self._balance == expected_balance)
 
     def __str__(self) -> str:
         """Return a string representation of the account."""
-        return f"Account {self._account_number} | {self._name} | Balance: £{self._balance:.2f}"
+        return f"Account {self._account_number} | {self._name} | Balance: {_fmt_money(self._balance / 100)}"
 
     @abstractmethod
-    def get_account_type(self) -> str:
+    def get_account_type(self) -> AccountType:
         """Return the type of account."""
         pass
 
@@ -200,18 +588,26 @@ class Account(ABC):
 class CheckingAccount(Account):
     """A checking account with no interest but unlimited transactions."""
 
+    __slots__ = ()
+
+    ACCOUNT_TYPE: ClassVar[AccountType] = AccountType.CHECKING
+
     def __init__(self, name: str, initial_balance: float = 0.0):
         """Initialize a new checking account."""
         super().__init__(name, initial_balance)
 
-    def get_account_type(self) -> str:
+    def get_account_type(self) -> AccountType:
         """Return the type of account."""
-        return "Checking"
+        return self.ACCOUNT_TYPE
 
 
 class SavingsAccount(Account):
     """A savings account with interest and withdrawal limits."""
 
+    __slots__ = ("_interest_rate", "_rate_ppm", "_withdrawal_limit", "_withdrawals_this_month", "_withdrawal_period")
+
+    ACCOUNT_TYPE: ClassVar[AccountType] = AccountType.SAVINGS
+
     def __init__(self, name: str, initial_balance: float = 0.0, interest_rate: float = 0.01):
         """
         Initialize a new savings account.
@@ -220,16 +616,40 @@ class SavingsAccount(Account):
             name: Account holder's name
             initial_balance: Starting balance
             interest_rate: Annual interest rate (default 1%)
+
+        Raises:
+            ValueError: If interest rate is negative or not finite
         """
+        self._check_interest_rate(interest_rate)
         super().__init__(name, initial_balance)
         self._interest_rate = interest_rate
+        self._rate_ppm = round(interest_rate * 1_000_000)  # Annual rate in parts per million, for integer accrual
+        self._withdrawal_limit = 3  # Monthly limit
+        self._withdrawals_this_month = 0
+        self._withdrawal_period = _current_period() if self._balance > 0 else None
+
+    @classmethod
+    def _fast_init(cls, name: str, interest_rate: float = 0.01) -> "SavingsAccount":
+        """Create a savings account with a zero balance, skipping the balance checks in __init__."""
+        cls._check_interest_rate(interest_rate)
+        self = super()._fast_init(name)
+        self._interest_rate = interest_rate
+        self._rate_ppm = round(interest_rate * 1_000_000)
         self._withdrawal_limit = 3  # Monthly limit
         self._withdrawals_this_month = 0
-        self._last_withdrawal_month = datetime.datetime.now().month if initial_balance > 0 else None
+        self._withdrawal_period = None
+        return self
+
+    @staticmethod
+    def _check_interest_rate(interest_rate: float) -> None:
+        """Raise ValueError unless interest_rate is a usable annual rate."""
+        # Written as "not in range" so that NaN is rejected as well
+        if not (0 <= interest_rate < math.inf):
+            raise ValueError("Interest rate must be a finite, non-negative number")
 
-    def get_account_type(self) -> str:
+    def get_account_type(self) -> AccountType:
         """Return the type of account."""
-        return "Savings"
+        return self.ACCOUNT_TYPE
 
     @property
     def interest_rate(self) -> float:
@@ -245,54 +665,70 @@ class SavingsAccount(Account):
     def withdrawals_remaining(self) -> int:
         """Get the number of withdrawals remaining this month."""
         # Reset if it's a new month
-        current_month = datetime.datetime.now().month
-        if self._last_withdrawal_month != current_month:
+        current_period = _current_period()
+        if self._withdrawal_period != current_period:
             self._withdrawals_this_month = 0
-            self._last_withdrawal_month = current_month
+            self._withdrawal_period = current_period
 
         return self._withdrawal_limit - self._withdrawals_this_month
 
-    def apply_interest(self) -> float:
+    def apply_interest(self, now: Optional[int] = None) -> float:
         """
         Apply monthly interest to the account.
 
+        Args:
+            now: Timestamp to record (defaults to current time)
+
         Returns:
             The amount of interest applied
         """
-        interest_amount = self._balance * (self._interest_rate / 12)  # Monthly interest
-        if interest_amount > 0:
-            self._balance += interest_amount
-            self._transactions.append(Transaction("interest", interest_amount, "Monthly interest"))
-            print(f"Applied monthly interest: £{interest_amount:.2f}")
-        return interest_amount
-
-    def withdraw(self, amount: float, description: str = "") -> None:
+        interest = self._accrue_interest(now)
+        if interest > 0 and self._on_balance_change:
+            self._on_balance_change(interest)
+        return interest / 100
+
+    def _accrue_interest(self, now: Optional[int]) -> int:
+        """Credit monthly interest without notifying the owning bank, returning it in pence."""
+        # balance * (ppm / 1_000_000) / 12 in integer arithmetic, rounded to the nearest penny
+        interest = (self._balance * self._rate_ppm + 6_000_000) // 12_000_000
+        if interest <= 0:
+            return 0  # Nothing credited, so nothing for the caller to add to its totals
+        self._transactions.append(Transaction(TransactionKind.INTEREST, interest / 100, "Monthly interest", now))
+        self._balance += interest
+        return interest
+
+    def withdraw(self, amount: float, description: str = "", now: Optional[int] = None) -> Transaction:
         """
         Withdraw money from the account with monthly limits.
 
         Args:
             amount: Amount to withdraw
             description: Optional description of the withdrawal
+            now: Timestamp to record (defaults to current time)
+
+        Returns:
+            The recorded withdrawal transaction
 
         Raises:
             InvalidAmountError: If amount is negative or zero
             InsufficientFundsError: If withdrawal would result in negative balance
             MonthlyWithdrawalLimitError: If monthly withdrawal limit is reached
         """
-        current_month = datetime.datetime.now().month
+        current_period = _current_period()
 
         # Reset withdrawal count if it's a new month
-        if self._last_withdrawal_month != current_month:
+        if self._withdrawal_period != current_period:
             self._withdrawals_this_month = 0
-            self._last_withdrawal_month = current_month
+            self._withdrawal_period = current_period
 
         # Check withdrawal limit
         if self._withdrawals_this_month >= self._withdrawal_limit:
             raise MonthlyWithdrawalLimitError(f"Monthly withdrawal limit ({self._withdrawal_limit}) reached")
 
         # Proceed with withdrawal
-        super().withdraw(amount, description)
+        transaction = super().withdraw(amount, description, now)
         self._withdrawals_this_month += 1
+        return transaction
 
     def get_account_summary(self) -> str:
         """Get a detailed summary of the savings account."""
@@ -316,7 +752,29 @@ class Bank:
             name: Name of the bank
         """
         self.name = name
-        self._accounts: Dict[str, Account] = {}
+        self._accounts: Dict[int, Account] = {}  # Keyed by the account number parsed as hex
+
+        # Accounts grouped by type, with running balance totals (in pence) kept
+        # up to date by each account's balance-change hook
+        self._checking: List[CheckingAccount] = []
+        self._savings: List[SavingsAccount] = []
+        self._checking_total = 0
+        self._savings_total = 0
+
+        # Bumped on every change to the account table or any balance, so cached
+        # output can tell whether it is still current
+        self._mutation_version = 0
+        self._stats_cache: Optional[Tuple[Tuple[int, str], str]] = None
+
+    def _on_checking_balance_change(self, delta: int) -> None:
+        """Update the checking balance total after a checking account changes."""
+        self._checking_total += delta
+        self._mutation_version += 1
+
+    def _on_savings_balance_change(self, delta: int) -> None:
+        """Update the savings balance total after a savings account changes."""
+        self._savings_total += delta
+        self._mutation_version += 1
 
     def create_account(self, account_type: str, name: str, initial_balance: float = 0.0,
                       interest_rate: float = 0.01) -> Account:
@@ -333,20 +791,75 @@ class Bank:
             The newly created account
 
         Raises:
-            ValueError: If account type is invalid
+            ValueError: If account type or interest rate is invalid
         """
         account_type = account_type.lower()
 
+        # Zero-balance accounts take the specialised constructor, which has nothing to validate
         if account_type == "checking":
-            account = CheckingAccount(name, initial_balance)
+            if initial_balance == 0.0:
+                account = CheckingAccount._fast_init(name)
+            else:
+                account = CheckingAccount(name, initial_balance)
+            account._on_balance_change = self._on_checking_balance_change
+            self._checking.append(account)
+            self._checking_total += account._balance
         elif account_type == "savings":
-            account = SavingsAccount(name, initial_balance, interest_rate)
+            if initial_balance == 0.0:
+                account = SavingsAccount._fast_init(name, interest_rate)
+            else:
+                account = SavingsAccount(name, initial_balance, interest_rate)
+            account._on_balance_change = self._on_savings_balance_change
+            self._savings.append(account)
+            self._savings_total += account._balance
         else:
             raise ValueError("Invalid account type. Choose 'checking' or 'savings'")
 
-        self._accounts[account.account_number] = account
+        self._accounts[account._account_key] = account
+        self._mutation_version += 1
         return account
 
+    def bulk_load(self, path: str) -> List[Account]:
+        """
+        Create accounts from a CSV file.
+
+        The file needs a header row with the columns account_type, name and
+        initial_balance, and optionally interest_rate (blank means the default).
+        Balances and rates are held to the same limits as the menu. Every row is
+        validated before any account is created, so a bad row leaves the bank
+        unchanged.
+
+        Args:
+            path: Path to the CSV file
+
+        Returns:
+            The newly created accounts, in file order
+
+        Raises:
+            ValueError: If a row has a missing or invalid value or account type
+        """
+        rows = []
+        with open(path, newline="", encoding="utf-8") as csv_file:
+            for line_number, row in enumerate(csv.DictReader(csv_file), start=2):
+                try:
+                    account_type = row["account_type"].strip().lower()
+                    if account_type not in ("checking", "savings"):
+                        raise ValueError(f"invalid account type {row['account_type']!r}")
+                    initial_balance = float(row["initial_balance"])
+                    if not (math.isfinite(initial_balance) and initial_balance >= 0):
+                        raise ValueError(f"invalid initial balance {row['initial_balance']!r}")
+                    _to_pence(initial_balance)  # Rejects balances too large to store
+                    rate = (row.get("interest_rate") or "").strip()
+                    rows.append((account_type, row["name"].strip(), initial_balance,
+                                 INTEREST_RATE(rate) if rate else 0.01))
+                except KeyError as e:
+                    raise ValueError(f"{path}: missing column {e}") from None
+                except (AttributeError, TypeError, ValueError, InvalidAmountError) as e:
+                    raise ValueError(f"{path}, line {line_number}: {e}") from None
+
+        return [self.create_account(account_type, name, initial_balance, interest_rate)
+                for account_type, name, initial_balance, interest_rate in rows]
+
     def get_account(self, account_number: str) -> Optional[Account]:
         """
         Get an account by its account number.
@@ -357,24 +870,38 @@ class Bank:
         Returns:
             The account if found, None otherwise
         """
-        return self._accounts.get(account_number)
+        try:
+            account = self._accounts.get(int(account_number, 16))
+        except (ValueError, TypeError):  # Not a hex string at all
+            return None
+
+        # int() also accepts forms like "0x..." or different case, so confirm an exact match
+        if account is None or account._account_number != account_number:
+            return None
+        return account
 
     def get_all_accounts(self) -> List[Account]:
         """Get a list of all accounts in the bank."""
         return list(self._accounts.values())
 
+    def get_account_count(self) -> int:
+        """Get the number of accounts in the bank without building a list."""
+        return len(self._accounts)
+
     def display_all_accounts(self) -> None:
         """Display all accounts in a formatted manner."""
         if not self._accounts:
             print("No accounts to display")
             return
 
-        print(f"\n===== {self.name} Accounts =====")
-        print("Account Number | Type     | Name                | Balance")
-        print("---------------|----------|---------------------|------------")
-        for account in self._accounts.values():
-            print(f"{account.account_number} | {account.get_account_type():<8} | {account.name:<20} | £{account.balance:.2f}")
-        print("==============================\n")
+        # Build every row first and emit them with a single write
+        out = [f"\n===== {self.name} Accounts =====",
+               "Account Number | Type     | Name                | Balance",
+               "---------------|----------|---------------------|------------"]
+        for acc in self._accounts.values():
+            out.append(_fmt_account_row(acc._account_number, acc.ACCOUNT_TYPE.label, acc._name, acc._balance / 100))
+        out.append("==============================\n")
+        sys.stdout.write("\n".join(out) + "\n")
 
     def apply_interest_to_savings_accounts(self) -> float:
         """
@@ -383,11 +910,15 @@ class Bank:
         Returns:
             Total interest applied
         """
-        total_interest = 0.0
-        for account in self._accounts.values():
-            if isinstance(account, SavingsAccount):
-                total_interest += account.apply_interest()
-        return total_interest
+        now = time.time_ns()  # One timestamp shared by the whole batch
+        total_interest = 0
+        for account in self._savings:
+            total_interest += account._accrue_interest(now)
+
+        # Fold the whole batch into the running total once rather than per account
+        self._savings_total += total_interest
+        self._mutation_version += 1
+        return total_interest / 100
 
     def transfer(self, from_account_number: str, to_account_number: str, amount: float) -> bool:
         """
@@ -421,64 +952,169 @@ class Bank:
             raise ValueError("Cannot transfer to the same account")
 
         # Check for valid amount
-        if amount <= 0:
-            raise InvalidAmountError("Transfer amount must be positive")
+        pence = _to_pence(amount)
+        Account._check_positive(pence, "Transfer")
 
         # Check for sufficient funds
-        if amount > from_account.balance:
+        if pence > from_account._balance:
             raise InsufficientFundsError(f"Insufficient funds. Current balance: £{from_account.balance:.2f}")
 
         # Perform transfer (withdrawal from source, deposit to destination)
         try:
-            # For savings account, check withdrawal limits
-            if isinstance(from_account, SavingsAccount):
-                # This will check withdrawal limits and raise an exception if needed
-                from_account.withdraw(amount, f"Transfer to account {to_account_number}")
-                # Add deposit to destination
-                to_account.deposit(amount, f"Transfer from account {from_account_number}")
-            else:
-                # For regular accounts, just withdraw and deposit
-                from_account.withdraw(amount, f"Transfer to account {to_account_number}")
-                to_account.deposit(amount, f"Transfer from account {from_account_number}")
-
-            print(f"Successfully transferred £{amount:.2f} from account {from_account_number} to {to_account_number}")
+            # withdraw() is polymorphic, so savings accounts enforce their withdrawal limits here
+            from_account.withdraw(amount, f"Transfer to account {to_account_number}")
+            to_account.deposit(amount, f"Transfer from account {from_account_number}")
             return True
 
         except Exception as e:
             print(f"Transfer failed: {e}")
             return False
 
-    def get_bank_statistics(self) -> dict:
-        """Get statistics about the bank and its accounts."""
-        total_accounts = len(self._accounts)
-        checking_accounts = sum(1 for acc in self._accounts.values() if isinstance(acc, CheckingAccount))
-        savings_accounts = sum(1 for acc in self._accounts.values() if isinstance(acc, SavingsAccount))
+    def transfer_many(self, from_account_numbers: Sequence[str], to_account_numbers: Sequence[str],
+                      amounts: Sequence[float]) -> int:
+        """
+        Perform a batch of transfers, either all of them or none.
+
+        Every transfer is validated before any balance changes. Funds and savings
+        withdrawal limits are checked against each source account's state before
+        the batch, so money received earlier in the batch cannot be sent on.
 
-        total_balance = sum(acc.balance for acc in self._accounts.values())
-        checking_balance = sum(acc.balance for acc in self._accounts.values() if isinstance(acc, CheckingAccount))
-        savings_balance = sum(acc.balance for acc in self._accounts.values() if isinstance(acc, SavingsAccount))
+        Args:
+            from_account_numbers: Account numbers to transfer from
+            to_account_numbers: Account numbers to transfer to, matched by position
+            amounts: Amounts to transfer, matched by position
+
+        Returns:
+            The number of transfers performed
+
+        Raises:
+            ValueError: If the sequences differ in length, an account is not found,
+                or a transfer targets its own source account
+            InvalidAmountError: If any amount is negative or zero
+            InsufficientFundsError: If a source account cannot cover its total outgoing amount
+            MonthlyWithdrawalLimitError: If a savings account would exceed its monthly withdrawal limit
+        """
+        if not len(from_account_numbers) == len(to_account_numbers) == len(amounts):
+            raise ValueError("Transfer batches must have the same number of sources, destinations and amounts")
+
+        # Validate every transfer and total the debits per source account before mutating anything
+        transfers = []
+        debits: Dict[int, int] = {}  # Pence
+        withdrawal_counts: Dict[int, int] = {}
+        for from_account_number, to_account_number, amount in zip(from_account_numbers, to_account_numbers, amounts):
+            from_account = self.get_account(from_account_number)
+            to_account = self.get_account(to_account_number)
+            if not from_account:
+                raise ValueError(f"Source account {from_account_number} not found")
+            if not to_account:
+                raise ValueError(f"Destination account {to_account_number} not found")
+            if from_account is to_account:
+                raise ValueError("Cannot transfer to the same account")
+            pence = _to_pence(amount)
+            Account._check_positive(pence, "Transfer")
+
+            key = from_account._account_key
+            debits[key] = debits.get(key, 0) + pence
+            withdrawal_counts[key] = withdrawal_counts.get(key, 0) + 1
+            transfers.append((from_account, to_account, amount))
+
+        for key, total in debits.items():
+            account = self._accounts[key]
+            if total > account._balance:
+                raise InsufficientFundsError(f"Insufficient funds in account {account._account_number}. "
+                                             f"Current balance: £{account._balance / 100:.2f}")
+            if (account.ACCOUNT_TYPE == AccountType.SAVINGS
+                    and withdrawal_counts[key] > account.withdrawals_remaining):
+                raise MonthlyWithdrawalLimitError(f"Monthly withdrawal limit ({account.withdrawal_limit}) "
+                                                  f"would be exceeded for account {account._account_number}")
+
+        now = time.time_ns()  # One timestamp shared by the whole batch
+        for from_account, to_account, amount in transfers:
+            from_account.withdraw(amount, f"Transfer to account {to_account._account_number}", now)
+            to_account.deposit(amount, f"Transfer from account {from_account._account_number}", now)
+        return len(transfers)
+
+    def withdraw_many(self, account_numbers: Sequence[str], amounts: Sequence[float]) -> List[bool]:
+        """
+        Apply a batch of withdrawals, skipping any that cannot be made.
 
+        Withdrawals are applied in order, so each one sees the balance left by the
+        previous ones. A rejected withdrawal on an existing account is recorded in
+        its history as a 'rejected' transaction without affecting the balance; an
+        amount that is not positive or not a storable number is recorded as £0.00
+        with the original value in the description.
+
+        Args:
+            account_numbers: Account numbers to withdraw from
+            amounts: Amounts to withdraw, matched by position
+
+        Returns:
+            A list with True at each position whose withdrawal was rejected
+
+        Raises:
+            ValueError: If the sequences differ in length
+        """
+        if len(account_numbers) != len(amounts):
+            raise ValueError("Withdrawal batches must have the same number of accounts and amounts")
+
+        now = time.time_ns()  # One timestamp shared by the whole batch
+        rejected: List[bool] = []
+        for account_number, amount in zip(account_numbers, amounts):
+            account = self.get_account(account_number)
+            if account is None:
+                rejected.append(True)
+                continue
+
+            try:
+                pence = _to_pence(amount)
+            except (InvalidAmountError, TypeError):
+                pence = 0
+            if pence <= 0:
+                account.add_transaction_record(TransactionKind.REJECTED, 0.0, f"Rejected withdrawal of {amount!r}", now)
+                rejected.append(True)
+                continue
+
+            if pence <= account._balance:
+                try:
+                    account.withdraw(amount, "", now)
+                    rejected.append(False)
+                    continue
+                except MonthlyWithdrawalLimitError:
+                    pass
+
+            account.add_transaction_record(TransactionKind.REJECTED, pence / 100, "Rejected withdrawal", now)
+            rejected.append(True)
+        return rejected
+
+    def get_bank_statistics(self) -> dict:
+        """Get statistics about the bank and its accounts."""
         return {
-            "total_accounts": total_accounts,
-            "checking_accounts": checking_accounts,
-            "savings_accounts": savings_accounts,
-            "total_balance": total_balance,
-            "checking_balance": checking_balance,
-            "savings_balance": savings_balance
+            "total_accounts": len(self._accounts),
+            "checking_accounts": len(self._checking),
+            "savings_accounts": len(self._savings),
+            "total_balance": (self._checking_total + self._savings_total) / 100,
+            "checking_balance": self._checking_total / 100,
+            "savings_balance": self._savings_total / 100
         }
 
     def display_bank_statistics(self) -> None:
         """Display statistics about the bank."""
-        stats = self.get_bank_statistics()
-
-        print(f"\n===== {self.name} Statistics =====")
-        print(f"Total accounts: {stats['total_accounts']}")
-        print(f"Checking accounts: {stats['checking_accounts']}")
-        print(f"Savings accounts: {stats['savings_accounts']}")
-        print(f"Total balance across all accounts: £{stats['total_balance']:.2f}")
-        print(f"Total balance in checking accounts: £{stats['checking_balance']:.2f}")
-        print(f"Total balance in savings accounts: £{stats['savings_balance']:.2f}")
-        print("===================================\n")
+        # Reuse the last rendering while no account or balance has changed
+        key = (self._mutation_version, self.name)
+        if self._stats_cache is None or self._stats_cache[0] != key:
+            stats = self.get_bank_statistics()
+            text = "\n".join([
+                f"\n===== {self.name} Statistics =====",
+                f"Total accounts: {stats['total_accounts']}",
+                f"Checking accounts: {stats['checking_accounts']}",
+                f"Savings accounts: {stats['savings_accounts']}",
+                "Total balance across all accounts: " + _fmt_money(stats['total_balance']),
+                "Total balance in checking accounts: " + _fmt_money(stats['checking_balance']),
+                "Total balance in savings accounts: " + _fmt_money(stats['savings_balance']),
+                "===================================\n"
+            ])
+            self._stats_cache = (key, text)
+        print(self._stats_cache[1])
 
 
 def clear_screen() -> None:
@@ -507,6 +1143,36 @@ def get_valid_input(prompt: str, validation_func: Callable[[str], Any], error_me
             print(error_message)
 
 
+def _int_range(lo: int, hi: int) -> Callable[[str], int]:
+    """Build a validator that accepts an integer between lo and hi inclusive."""
+    def validate(text: str) -> int:
+        value = int(text)
+        if not lo <= value <= hi:
+            raise ValueError(f"{value} is not between {lo} and {hi}")
+        return value
+    return validate
+
+
+def _float_range(lo: float, hi: float = float("inf"), include_lo: bool = True) -> Callable[[str], float]:
+    """Build a validator that accepts a number from lo (optionally exclusive) up to hi."""
+    def validate(text: str) -> float:
+        value = float(text)
+        # Written as "not in range" so that NaN is rejected as well
+        if not ((lo <= value if include_lo else lo < value) and value <= hi):
+            raise ValueError(f"{value} is out of range")
+        return value
+    return validate
+
+
+# Input validators shared by every menu iteration
+CHOICE_1_7 = _int_range(1, 7)
+CHOICE_1_5 = _int_range(1, 5)
+CHOICE_1_2 = _int_range(1, 2)
+POS_FLOAT = _float_range(0.0, include_lo=False)
+NON_NEG_FLOAT = _float_range(0.0)
+INTEREST_RATE = _float_range(0.0, 0.1)
+
+
 def main() -> None:
     """Main function to run the banking application."""
     # Set the bank name
@@ -531,7 +1197,7 @@ def main() -> None:
         print("7. Exit")
 
         choice = get_valid_input("Enter your choice (1-7): ",
-                              lambda x: int(x) if 1 <= int(x) <= 7 else ValueError(),
+                              CHOICE_1_7,
                               "Invalid choice. Please enter a number between 1 and 7.")
 
         if choice == 1:
@@ -542,27 +1208,27 @@ def main() -> None:
             print("2. Savings Account")
 
             account_type_choice = get_valid_input("Select account type (1-2): ",
-                                              lambda x: int(x) if 1 <= int(x) <= 2 else ValueError(),
+                                              CHOICE_1_2,
                                               "Invalid choice. Please enter 1 or 2.")
 
             account_type = "checking" if account_type_choice == 1 else "savings"
             name = input("Enter account holder's name: ")
 
             initial_balance = get_valid_input("Enter initial balance: £",
-                                         lambda x: float(x) if float(x) >= 0 else ValueError(),
+                                         NON_NEG_FLOAT,
                                          "Invalid amount. Please enter a non-negative number.")
 
             interest_rate = 0.01  # Default interest rate
             if account_type == "savings":
                 interest_rate = get_valid_input("Enter annual interest rate (e.g., 0.01 for 1%): ",
-                                           lambda x: float(x) if 0 <= float(x) <= 0.1 else ValueError(),
+                                           INTEREST_RATE,
                                            "Invalid interest rate. Please enter a number between 0 and 0.1.")
 
             try:
                 account = bank.create_account(account_type, name, initial_balance, interest_rate)
                 print(f"\nAccount created successfully!")
                 print(f"Account Number: {account.account_number}")
-                print(f"Account Type: {account.get_account_type()}")
+                print(f"Account Type: {account.get_account_type().label}")
                 print(f"Initial Balance: £{account.balance:.2f}")
                 if account_type == "savings":
                     print(f"Interest Rate: {interest_rate:.2%}")
@@ -574,7 +1240,7 @@ def main() -> None:
 
         elif choice == 2:
             # Select an existing account
-            if not bank.get_all_accounts():
+            if not bank.get_account_count():
                 print("No accounts exist. Please create an account first.")
                 continue
 
@@ -596,10 +1262,10 @@ def main() -> None:
             while True:
                 clear_screen()
                 print(f"\n=== Account: {account.account_number} ({account.name}) ===")
-                print(f"Type: {account.get_account_type()}")
+                print(f"Type: {account.get_account_type().label}")
                 print(f"Current Balance: £{account.balance:.2f}")
 
-                if isinstance(account, SavingsAccount):
+                if account.ACCOUNT_TYPE == AccountType.SAVINGS:
                     print(f"Interest Rate: {account.interest_rate:.2%}")
                     print(f"Withdrawals Remaining This Month: {account.withdrawals_remaining}")
 
@@ -610,17 +1276,18 @@ def main() -> None:
                 print("5. Return to Main Menu")
 
                 account_choice = get_valid_input("Enter your choice (1-5): ",
-                                            lambda x: int(x) if 1 <= int(x) <= 5 else ValueError(),
+                                            CHOICE_1_5,
                                             "Invalid choice. Please enter a number between 1 and 5.")
 
                 if account_choice == 1:
                     # Deposit
                     amount = get_valid_input("Enter deposit amount: £",
-                                        lambda x: float(x) if float(x) > 0 else ValueError(),
+                                        POS_FLOAT,
                                         "Invalid amount. Please enter a positive number.")
                     description = input("Enter deposit description (optional): ")
                     try:
-                        account.deposit(amount, description)
+                        transaction = account.deposit(amount, description)
+                        print(f"Deposited £{transaction.amount:.2f} successfully")
                     except Exception as e:
                         print(f"Error: {e}")
                     input("\nPress Enter to continue...")
@@ -628,11 +1295,12 @@ def main() -> None:
                 elif account_choice == 2:
                     # Withdraw
                     amount = get_valid_input("Enter withdrawal amount: £",
-                                        lambda x: float(x) if float(x) > 0 else ValueError(),
+                                        POS_FLOAT,
                                         "Invalid amount. Please enter a positive number.")
                     description = input("Enter withdrawal description (optional): ")
                     try:
-                        account.withdraw(amount, description)
+                        transaction = account.withdraw(amount, description)
+                        print(f"Withdrew £{transaction.amount:.2f} successfully")
                     except Exception as e:
                         print(f"Error: {e}")
                     input("\nPress Enter to continue...")
@@ -659,7 +1327,7 @@ def main() -> None:
         elif choice == 4:
             # Transfer between accounts
             clear_screen()
-            if len(bank.get_all_accounts()) < 2:
+            if bank.get_account_count() < 2:
                 print("You need at least two accounts to perform a transfer. Please create more accounts.")
                 input("\nPress Enter to continue...")
                 continue
@@ -689,11 +1357,13 @@ def main() -> None:
 
             # Get transfer amount
             amount = get_valid_input("Enter transfer amount: £",
-                                 lambda x: float(x) if float(x) > 0 else ValueError(),
+                                 POS_FLOAT,
                                  "Invalid amount. Please enter a positive number.")
 
             try:
-                bank.transfer(from_account_number, to_account_number, amount)
+                if bank.transfer(from_account_number, to_account_number, amount):
+                    print(f"Successfully transferred £{amount:.2f} from account {from_account_number} "
+                          f"to {to_account_number}")
             except Exception as e:
                 print(f"Transfer error: {e}")
 
@@ -746,6 +1416,10 @@ CLASSES AND THEIR PURPOSES:
    - Records transaction type, amount, description, and timestamp
    - Provides string representation for display
 
+   TransactionLog:
+   - Stores an account's history column by column in compact arrays
+   - Rebuilds Transaction objects only when history is read
+
 2. Account (Abstract Base Class):
    - Defines the common structure for all account types
    - Cannot be instantiated directly (abstract)
@@ -768,7 +1442,11 @@ CLASSES AND THEIR PURPOSES:
    - Provides operations spanning multiple accounts (transfers, interest application)
    - Calculates bank-wide statistics across all accounts
 
-6. Custom Exceptions:
+6. AccountType and TransactionKind:
+   - Integer enums identifying account and transaction kinds
+   - Mapped to display names only when printed
+
+7. Custom Exceptions:
    - InsufficientFundsError: For withdrawals exceeding available balance
    - InvalidAmountError: For negative or zero transaction amounts
    - MonthlyWithdrawalLimitError: For exceeding savings account withdrawal limits
@@ -793,7 +1471,7 @@ IMPLEMENTATION OF OOP PRINCIPLES:
 4. Polymorphism:
    - Bank class operates on Account objects without knowing their specific types
    - withdraw() method behaves differently based on account type
-   - instance checking allows type-specific operations (e.g., applying interest)
+   - the ACCOUNT_TYPE class attribute allows type-specific operations (e.g., withdrawal limits)
 
 KEY METHODS AND WORKFLOWS:
 -------------------------
@@ -807,7 +1485,8 @@ KEY METHODS AND WORKFLOWS:
    - Bank.transfer() moves funds between accounts
 
 3. Account Management:
-   - get_transaction_history() and display_transaction_history() show transaction records
+   - snapshot_transactions(), iter_transactions(), get_transaction_history() and
+     display_transaction_history() expose transaction records
    - get_account_summary() provides detailed account information
    - SavingsAccount.apply_interest() calculates and adds monthly interest
 
@@ -0,0 +1,138 @@
+import os
+import tempfile
+import unittest
+
+from banking import Bank, InsufficientFundsError, InvalidAmountError, MonthlyWithdrawalLimitError, TransactionKind
+
+
+class BulkLoadTest(unittest.TestCase):
+    """Bank.bulk_load must leave the bank unchanged when any row is bad."""
+
+    HEADER = "account_type,name,initial_balance,interest_rate\n"
+
+    def setUp(self):
+        self.bank = Bank("Test Bank")
+        self.bank.create_account("checking", "Existing", 10.0)
+
+    def load(self, body: str):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as csv_file:
+            csv_file.write(self.HEADER + body)
+        return self.bank.bulk_load(path)
+
+    def assert_rejected(self, bad_row: str):
+        with self.assertRaises(ValueError):
+            self.load("checking,Alice,5.00,\n" + bad_row + "\n")
+        self.assertEqual(self.bank.get_account_count(), 1)
+
+    def test_valid_file_creates_accounts(self):
+        accounts = self.load("checking,Alice,5.00,\nsavings,Bob,20.00,0.02\n")
+        self.assertEqual(len(accounts), 2)
+        self.assertEqual(self.bank.get_account_count(), 3)
+        self.assertEqual(accounts[1].interest_rate, 0.02)
+
+    def test_non_finite_rate_leaves_bank_unchanged(self):
+        self.assert_rejected("savings,Bob,20.00,nan")
+        self.assert_rejected("savings,Bob,20.00,inf")
+
+    def test_out_of_range_rate_leaves_bank_unchanged(self):
+        self.assert_rejected("savings,Bob,20.00,-3")
+        self.assert_rejected("savings,Bob,20.00,7")
+
+    def test_unstorable_balance_leaves_bank_unchanged(self):
+        self.assert_rejected("savings,Bob,1e20,")
+
+    def test_bad_account_type_leaves_bank_unchanged(self):
+        self.assert_rejected("current,Bob,20.00,")
+
+
+class TransferManyTest(unittest.TestCase):
+    """Bank.transfer_many must apply every transfer or none of them."""
+
+    def setUp(self):
+        self.bank = Bank("Test Bank")
+        self.checking = self.bank.create_account("checking", "Alice", 100.0)
+        self.savings = self.bank.create_account("savings", "Bob", 100.0)
+        self.other = self.bank.create_account("checking", "Carol", 0.0)
+
+    def snapshot(self):
+        accounts = self.bank.get_all_accounts()
+        return ([account.balance for account in accounts],
+                [len(account.snapshot_transactions()) for account in accounts],
+                self.bank.get_bank_statistics())
+
+    def assert_rejected(self, error, sources, destinations, amounts):
+        before = self.snapshot()
+        with self.assertRaises(error):
+            self.bank.transfer_many(sources, destinations, amounts)
+        self.assertEqual(self.snapshot(), before)
+
+    def test_valid_batch_applies_every_transfer(self):
+        count = self.bank.transfer_many([self.checking.account_number, self.savings.account_number],
+                                        [self.other.account_number, self.other.account_number], [10.0, 20.0])
+        self.assertEqual(count, 2)
+        self.assertEqual(self.other.balance, 30.0)
+        self.assertEqual(self.bank.get_bank_statistics()["total_balance"], 200.0)
+
+    def test_failing_row_after_valid_rows_changes_nothing(self):
+        sources = [self.checking.account_number, self.savings.account_number, self.checking.account_number]
+        destinations = [self.other.account_number, self.other.account_number, self.other.account_number]
+        self.assert_rejected(InvalidAmountError, sources, destinations, [10.0, 5.0, -1.0])
+        self.assert_rejected(ValueError, sources, destinations[:2] + ["zzzzzzzz"], [10.0, 5.0, 1.0])
+
+    def test_batch_overdrawing_source_in_total_changes_nothing(self):
+        sources = [self.checking.account_number] * 3
+        destinations = [self.other.account_number] * 3
+        self.assert_rejected(InsufficientFundsError, sources, destinations, [40.0, 40.0, 40.0])
+
+    def test_savings_withdrawal_limit_across_rows_changes_nothing(self):
+        sources = [self.savings.account_number] * 4
+        destinations = [self.other.account_number] * 4
+        self.assert_rejected(MonthlyWithdrawalLimitError, sources, destinations, [1.0] * 4)
+        self.assertEqual(self.savings.withdrawals_remaining, 3)
+
+
+class WithdrawManyTest(unittest.TestCase):
+    """Bank.withdraw_many must mark and log every rejected withdrawal without stopping."""
+
+    def setUp(self):
+        self.bank = Bank("Test Bank")
+        self.checking = self.bank.create_account("checking", "Alice", 100.0)
+        self.savings = self.bank.create_account("savings", "Bob", 100.0)
+
+    def rejections(self, account):
+        return [(t.amount, t.description) for t in account.snapshot_transactions()
+                if t.transaction_type == TransactionKind.REJECTED]
+
+    def test_unknown_account_is_rejected(self):
+        self.assertEqual(self.bank.withdraw_many(["zzzzzzzz", None, self.checking.account_number], [1.0, 1.0, 1.0]),
+                         [True, True, False])
+        self.assertEqual(self.checking.balance, 99.0)
+
+    def test_unusable_amounts_are_rejected_and_logged_as_zero(self):
+        number = self.checking.account_number
+        mask = self.bank.withdraw_many([number] * 5, [10.0, float("nan"), None, -1.0, 1e30])
+        self.assertEqual(mask, [False, True, True, True, True])
+        self.assertEqual(self.checking.balance, 90.0)
+        self.assertEqual(self.rejections(self.checking), [(0.0, "Rejected withdrawal of nan"),
+                                                          (0.0, "Rejected withdrawal of None"),
+                                                          (0.0, "Rejected withdrawal of -1.0"),
+                                                          (0.0, "Rejected withdrawal of 1e+30")])
+
+    def test_insufficient_funds_is_rejected(self):
+        number = self.checking.account_number
+        self.assertEqual(self.bank.withdraw_many([number] * 3, [60.0, 60.0, 40.0]), [False, True, False])
+        self.assertEqual(self.checking.balance, 0.0)
+        self.assertEqual(self.rejections(self.checking), [(60.0, "Rejected withdrawal")])
+
+    def test_savings_withdrawal_limit_is_rejected(self):
+        number = self.savings.account_number
+        self.assertEqual(self.bank.withdraw_many([number] * 4, [1.0] * 4), [False, False, False, True])
+        self.assertEqual(self.savings.balance, 97.0)
+        self.assertEqual(self.rejections(self.savings), [(1.0, "Rejected withdrawal")])
+        self.assertEqual(self.bank.get_bank_statistics()["savings_balance"], 97.0)
+
+
+if __name__ == "__main__":
+    unittest.main()